@@ -1,29 +1,48 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Request, Response, Depends
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Response, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
+import asyncio
+import base64
 import uuid
 from datetime import datetime, timezone, timedelta
+from cachetools import TTLCache
 import httpx
 import json
+import jwt
+import orjson
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection, opened on startup so each worker process gets its own pool.
+# Size MONGO_POOL for the worker count, e.g. with
+# gunicorn -k uvicorn.workers.UvicornWorker -w $((2 * CPUS + 1)) server:app
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+client: Optional[AsyncMongoClient] = None
+db = None
+
+# Signing key for session tokens
+JWT_SECRET = os.environ.get('JWT_SECRET')
+if not JWT_SECRET:
+    raise RuntimeError(
+        "JWT_SECRET is not set; add a long random value to backend/.env (see backend/.env.example)"
+    )
+
+# Shared HTTP client for outbound calls, opened on startup
+http_client: Optional[httpx.AsyncClient] = None
 
 # Create the main app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # Session middleware for cookies
@@ -32,6 +51,34 @@ app.add_middleware(SessionMiddleware, secret_key="blood-donation-secret-key-1234
 # Security
 security = HTTPBearer(auto_error=False)
 
+# Session cache: session_token -> (User, expires_at)
+session_cache = TTLCache(maxsize=10_000, ttl=60)
+
+def cache_session(session_token: str, user: "User", expires_at: datetime):
+    session_cache[session_token] = (user, expires_at)
+
+def invalidate_session(session_token: str):
+    session_cache.pop(session_token, None)
+
+def invalidate_user_sessions(user_id: str):
+    # The cache is bounded, so a scan is cheap and nothing outlives its entries
+    for session_token, (user, _) in list(session_cache.items()):
+        if user.id == user_id:
+            session_cache.pop(session_token, None)
+
+# Platform stats tolerate a few seconds of staleness
+stats_cache = TTLCache(maxsize=1, ttl=5)
+
+# Blood request details by id, dropped whenever the request is mutated
+request_cache = TTLCache(maxsize=1024, ttl=30)
+# Bumped on every drop so a read that raced a mutation does not refill the cache
+request_cache_generation = 0
+
+def invalidate_request(request_id: str):
+    global request_cache_generation
+    request_cache_generation += 1
+    request_cache.pop(request_id, None)
+
 # Models
 class User(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -52,6 +99,21 @@ class UserCreate(BaseModel):
     phone: Optional[str] = None
     emergency_contact: Optional[str] = None
 
+class UserUpdate(BaseModel):
+    name: Optional[str] = None
+    user_type: Optional[str] = None
+    city: Optional[str] = None
+    phone: Optional[str] = None
+    emergency_contact: Optional[str] = None
+
+    @field_validator("name", "user_type", "city")
+    @classmethod
+    def reject_null(cls, value):
+        # Required on User, so they may be omitted but never set to null
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
 class BloodRequest(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     requester_id: str
@@ -94,6 +156,14 @@ class DonorResponseCreate(BaseModel):
     request_id: str
     message: str
 
+class BloodRequestPage(BaseModel):
+    items: List[BloodRequest]
+    next_cursor: Optional[str] = None
+
+class DonorResponsePage(BaseModel):
+    items: List[DonorResponse]
+    next_cursor: Optional[str] = None
+
 class Session(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -101,6 +171,67 @@ class Session(BaseModel):
     expires_at: datetime
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+# Field names of the flat models, used to build Mongo documents without model_dump
+BLOOD_REQUEST_KEYS = tuple(BloodRequest.model_fields)
+DONOR_RESPONSE_KEYS = tuple(DonorResponse.model_fields)
+
+# Read projections returning exactly the model fields, so raw documents can be sent without a model
+BLOOD_REQUEST_PROJECTION = {"_id": 0, **{key: 1 for key in BLOOD_REQUEST_KEYS}}
+DONOR_RESPONSE_PROJECTION = {"_id": 0, **{key: 1 for key in DONOR_RESPONSE_KEYS}}
+
+def to_mongo_doc(model: BaseModel, keys: tuple) -> dict:
+    return {key: getattr(model, key) for key in keys}
+
+# Pagination helpers: cursors encode the (created_at, id) of the last item on a page
+def encode_cursor(doc: dict) -> str:
+    raw = f"{doc['created_at'].isoformat()}|{doc['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        created_at, last_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        created_at = datetime.fromisoformat(created_at)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "id": {"$lt": last_id}}
+    ]}
+
+async def paginate(collection, query: dict, projection: dict, limit: int, cursor: Optional[str]) -> StreamingResponse:
+    """Stream one page as {"items": [...], "next_cursor": ...}, encoding documents as they arrive"""
+    if cursor:
+        query = {**query, **decode_cursor(cursor)}
+    docs = collection.find(query, projection).sort([("created_at", -1), ("id", -1)]).limit(limit)
+    
+    # Run the query before committing to a 200 so database errors still surface as errors
+    try:
+        first = await docs.next()
+    except StopAsyncIteration:
+        first = None
+    except BaseException:
+        await docs.close()
+        raise
+    
+    async def body():
+        try:
+            yield b'{"items":['
+            count = 0
+            last = first
+            if first is not None:
+                yield orjson.dumps(first)
+                count = 1
+                async for doc in docs:
+                    yield b"," + orjson.dumps(doc)
+                    count += 1
+                    last = doc
+            next_cursor = encode_cursor(last) if count == limit else None
+            yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+        finally:
+            await docs.close()
+    
+    return StreamingResponse(body(), media_type="application/json")
+
 # Authentication helpers
 async def get_current_user(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)):
     session_token = None
@@ -116,25 +247,53 @@ async def get_current_user(request: Request, credentials: HTTPAuthorizationCrede
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    # Find session in database
-    session = await db.sessions.find_one({"session_token": session_token})
-    if not session:
-        raise HTTPException(status_code=401, detail="Session expired")
-    
-    # Handle timezone-aware datetime comparison
-    expires_at = session["expires_at"]
-    if expires_at.tzinfo is None:
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    # Serve repeat requests from the session cache, still enforcing expiry
+    cached = session_cache.get(session_token)
+    if cached:
+        user, expires_at = cached
+        if datetime.now(timezone.utc) > expires_at:
+            invalidate_session(session_token)
+            raise HTTPException(status_code=401, detail="Session expired")
+        return user
     
-    if datetime.now(timezone.utc) > expires_at:
+    try:
+        claims = jwt.decode(session_token, JWT_SECRET, algorithms=["HS256"])
+    except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Session expired")
+    except jwt.InvalidTokenError:
+        claims = None
+    
+    if claims:
+        # Signed token: only the user and the logout revocation list need checking
+        expires_at = datetime.fromtimestamp(claims["exp"], timezone.utc)
+        user, revoked = await asyncio.gather(
+            db.users.find_one({"id": claims["sub"]}, {"_id": 0}),
+            db.revoked_sessions.find_one({"session_token": session_token}, {"_id": 1})
+        )
+        if revoked:
+            raise HTTPException(status_code=401, detail="Session expired")
+    else:
+        # Legacy opaque token: find session in database
+        session = await db.sessions.find_one({"session_token": session_token}, {"_id": 0})
+        if not session:
+            raise HTTPException(status_code=401, detail="Session expired")
+        
+        # Handle timezone-aware datetime comparison
+        expires_at = session["expires_at"]
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        
+        if datetime.now(timezone.utc) > expires_at:
+            raise HTTPException(status_code=401, detail="Session expired")
+        
+        user = await db.users.find_one({"id": session["user_id"]}, {"_id": 0})
     
-    # Get user
-    user = await db.users.find_one({"id": session["user_id"]})
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     
-    return User(**user)
+    user = User.model_construct(**user)
+    cache_session(session_token, user, expires_at)
+    return user
 
 # Auth routes
 @api_router.get("/auth/profile")
@@ -145,19 +304,20 @@ async def get_profile(request: Request):
         raise HTTPException(status_code=400, detail="Missing session_id")
     
     # Call Emergent auth API to get user data
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data",
-                headers={"X-Session-ID": session_id}
-            )
-            response.raise_for_status()
-            user_data = response.json()
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Authentication failed: {str(e)}")
+    try:
+        response = await http_client.get(
+            "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data",
+            headers={"X-Session-ID": session_id}
+        )
+        response.raise_for_status()
+        user_data = response.json()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Authentication failed: {str(e)}")
+    
+    now = datetime.now(timezone.utc)
     
     # Create or get existing user
-    existing_user = await db.users.find_one({"email": user_data["email"]})
+    existing_user = await db.users.find_one({"email": user_data["email"]}, {"_id": 0})
     if not existing_user:
         # New user - we'll set default values, user can update later
         user = User(
@@ -165,21 +325,19 @@ async def get_profile(request: Request):
             name=user_data["name"],
             picture=user_data.get("picture"),
             user_type="requester",  # Default type
-            city="Unknown"  # Will be updated by user
+            city="Unknown",  # Will be updated by user
+            created_at=now
         )
-        await db.users.insert_one(user.dict())
+        await db.users.insert_one(user.model_dump())
     else:
-        user = User(**existing_user)
-    
-    # Create session
-    session_token = user_data["session_token"]
-    expires_at = datetime.now(timezone.utc) + timedelta(days=7)
-    session = Session(
-        user_id=user.id,
-        session_token=session_token,
-        expires_at=expires_at
-    )
-    await db.sessions.insert_one(session.dict())
+        user = User.model_construct(**existing_user)
+    
+    # Issue a signed session token; validating it needs no session lookup
+    expires_at = now + timedelta(days=7)
+    session_token = jwt.encode({"sub": user.id, "exp": expires_at}, JWT_SECRET, algorithm="HS256")
+    
+    # Prime the session cache so the first authenticated call skips both lookups
+    cache_session(session_token, user, expires_at)
     
     return {
         "user": user,
@@ -214,24 +372,48 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     return current_user
 
 @api_router.put("/auth/profile", response_model=User)
-async def update_profile(profile_update: dict, current_user: User = Depends(get_current_user)):
+async def update_profile(profile_update: UserUpdate, current_user: User = Depends(get_current_user)):
     """Update user profile"""
-    # Update user in database
+    patch = profile_update.model_dump(exclude_unset=True)
+    if not patch:
+        return current_user
+    
+    # Update only the fields that were sent
     await db.users.update_one(
         {"id": current_user.id},
-        {"$set": profile_update}
+        {"$set": patch}
     )
+    invalidate_user_sessions(current_user.id)
     
-    # Return updated user
-    updated_user = await db.users.find_one({"id": current_user.id})
-    return User(**updated_user)
+    # Return updated user without reading it back
+    return current_user.model_copy(update=patch)
 
 @api_router.post("/auth/logout")
-async def logout(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+async def logout(
+    request: Request,
+    response: Response,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_user)
+):
     """Logout user"""
-    session_token = request.cookies.get("session_token")
+    # End the session that authenticated this call, header first like get_current_user
+    session_token = credentials.credentials if credentials else request.cookies.get("session_token")
     if session_token:
-        await db.sessions.delete_one({"session_token": session_token})
+        invalidate_session(session_token)
+        try:
+            claims = jwt.decode(session_token, JWT_SECRET, algorithms=["HS256"])
+        except jwt.InvalidTokenError:
+            claims = None
+        
+        if claims:
+            # Signed tokens stay valid until revoked or expired
+            await db.revoked_sessions.update_one(
+                {"session_token": session_token},
+                {"$setOnInsert": {"expires_at": datetime.fromtimestamp(claims["exp"], timezone.utc)}},
+                upsert=True
+            )
+        else:
+            await db.sessions.delete_one({"session_token": session_token})
     
     response.delete_cookie("session_token", path="/")
     return {"message": "Logged out successfully"}
@@ -244,14 +426,21 @@ async def create_blood_request(request_data: BloodRequestCreate, current_user: U
         requester_id=current_user.id,
         requester_name=current_user.name,
         requester_phone=current_user.phone or "Not provided",
-        **request_data.dict()
+        created_at=datetime.now(timezone.utc),
+        **request_data.model_dump()
     )
     
-    await db.blood_requests.insert_one(blood_request.dict())
+    await db.blood_requests.insert_one(to_mongo_doc(blood_request, BLOOD_REQUEST_KEYS))
     return blood_request
 
-@api_router.get("/requests", response_model=List[BloodRequest])
-async def get_blood_requests(city: Optional[str] = None, urgency: Optional[str] = None, status: str = "active"):
+@api_router.get("/requests", response_model=BloodRequestPage)
+async def get_blood_requests(
+    city: Optional[str] = None,
+    urgency: Optional[str] = None,
+    status: str = "active",
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None
+):
     """Get blood requests with optional filters"""
     query = {"status": status}
     if city:
@@ -259,27 +448,36 @@ async def get_blood_requests(city: Optional[str] = None, urgency: Optional[str]
     if urgency:
         query["urgency"] = urgency
     
-    requests = await db.blood_requests.find(query).sort("created_at", -1).to_list(1000)
-    return [BloodRequest(**req) for req in requests]
-
-@api_router.get("/requests/my", response_model=List[BloodRequest])
-async def get_my_requests(current_user: User = Depends(get_current_user)):
+    # Stored documents already match BloodRequest; response_model only documents the schema
+    return await paginate(db.blood_requests, query, BLOOD_REQUEST_PROJECTION, limit, cursor)
+
+@api_router.get("/requests/my", response_model=BloodRequestPage)
+async def get_my_requests(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
     """Get current user's blood requests"""
-    requests = await db.blood_requests.find({"requester_id": current_user.id}).sort("created_at", -1).to_list(1000)
-    return [BloodRequest(**req) for req in requests]
+    return await paginate(db.blood_requests, {"requester_id": current_user.id}, BLOOD_REQUEST_PROJECTION, limit, cursor)
 
 @api_router.get("/requests/{request_id}", response_model=BloodRequest)
 async def get_request_details(request_id: str):
     """Get specific blood request details"""
-    request = await db.blood_requests.find_one({"id": request_id})
+    request = request_cache.get(request_id)
     if not request:
-        raise HTTPException(status_code=404, detail="Request not found")
-    return BloodRequest(**request)
+        generation = request_cache_generation
+        request = await db.blood_requests.find_one({"id": request_id}, BLOOD_REQUEST_PROJECTION)
+        if not request:
+            raise HTTPException(status_code=404, detail="Request not found")
+        # Skip the fill if the request may have changed while it was being read
+        if generation == request_cache_generation:
+            request_cache[request_id] = request
+    return ORJSONResponse(content=request)
 
 @api_router.put("/requests/{request_id}/status")
 async def update_request_status(request_id: str, status_data: dict, current_user: User = Depends(get_current_user)):
     """Update request status"""
-    request = await db.blood_requests.find_one({"id": request_id})
+    request = await db.blood_requests.find_one({"id": request_id}, {"_id": 0, "requester_id": 1})
     if not request:
         raise HTTPException(status_code=404, detail="Request not found")
     
@@ -290,6 +488,7 @@ async def update_request_status(request_id: str, status_data: dict, current_user
         {"id": request_id},
         {"$set": {"status": status_data["status"]}}
     )
+    invalidate_request(request_id)
     
     return {"message": "Status updated"}
 
@@ -297,71 +496,91 @@ async def update_request_status(request_id: str, status_data: dict, current_user
 @api_router.post("/responses", response_model=DonorResponse)
 async def create_donor_response(response_data: DonorResponseCreate, current_user: User = Depends(get_current_user)):
     """Create a donor response to a blood request"""
-    # Check if request exists
-    request = await db.blood_requests.find_one({"id": response_data.request_id})
+    # Count the response against an active request in the same round trip that checks it exists
+    request = await db.blood_requests.find_one_and_update(
+        {"id": response_data.request_id, "status": "active"},
+        {"$inc": {"responses_count": 1}},
+        projection={"_id": 0, "id": 1},
+        return_document=ReturnDocument.AFTER
+    )
     if not request:
         raise HTTPException(status_code=404, detail="Request not found")
+    invalidate_request(response_data.request_id)
     
-    # Check if user already responded
-    existing_response = await db.donor_responses.find_one({
-        "request_id": response_data.request_id,
-        "donor_id": current_user.id
-    })
-    if existing_response:
-        raise HTTPException(status_code=400, detail="You have already responded to this request")
-    
-    donor_response = DonorResponse(
-        donor_id=current_user.id,
-        donor_name=current_user.name,
-        donor_phone=current_user.phone or "Not provided",
-        donor_email=current_user.email,
-        **response_data.dict()
-    )
-    
-    await db.donor_responses.insert_one(donor_response.dict())
-    
-    # Update request response count
-    await db.blood_requests.update_one(
-        {"id": response_data.request_id},
-        {"$inc": {"responses_count": 1}}
-    )
+    # Unique (request_id, donor_id) index rejects repeat responses
+    try:
+        donor_response = DonorResponse(
+            donor_id=current_user.id,
+            donor_name=current_user.name,
+            donor_phone=current_user.phone or "Not provided",
+            donor_email=current_user.email,
+            created_at=datetime.now(timezone.utc),
+            **response_data.model_dump()
+        )
+        await db.donor_responses.insert_one(to_mongo_doc(donor_response, DONOR_RESPONSE_KEYS))
+    except Exception as e:
+        # Undo the increment for any response that was not stored
+        await db.blood_requests.update_one(
+            {"id": response_data.request_id},
+            {"$inc": {"responses_count": -1}}
+        )
+        invalidate_request(response_data.request_id)
+        if isinstance(e, DuplicateKeyError):
+            raise HTTPException(status_code=400, detail="You have already responded to this request")
+        raise
     
     return donor_response
 
-@api_router.get("/responses/request/{request_id}", response_model=List[DonorResponse])
-async def get_request_responses(request_id: str, current_user: User = Depends(get_current_user)):
+@api_router.get("/responses/request/{request_id}", response_model=DonorResponsePage)
+async def get_request_responses(
+    request_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
     """Get all responses for a specific request (only for request owner)"""
-    request = await db.blood_requests.find_one({"id": request_id})
+    request = await db.blood_requests.find_one({"id": request_id}, {"_id": 0, "requester_id": 1})
     if not request:
         raise HTTPException(status_code=404, detail="Request not found")
     
     if request["requester_id"] != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    responses = await db.donor_responses.find({"request_id": request_id}).sort("created_at", -1).to_list(1000)
-    return [DonorResponse(**resp) for resp in responses]
-
-@api_router.get("/responses/my", response_model=List[DonorResponse])
-async def get_my_responses(current_user: User = Depends(get_current_user)):
+    return await paginate(db.donor_responses, {"request_id": request_id}, DONOR_RESPONSE_PROJECTION, limit, cursor)
+
+@api_router.get("/responses/my", response_model=DonorResponsePage)
+async def get_my_responses(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
     """Get current user's donor responses"""
-    responses = await db.donor_responses.find({"donor_id": current_user.id}).sort("created_at", -1).to_list(1000)
-    return [DonorResponse(**resp) for resp in responses]
+    return await paginate(db.donor_responses, {"donor_id": current_user.id}, DONOR_RESPONSE_PROJECTION, limit, cursor)
 
 # Stats route
 @api_router.get("/stats")
 async def get_stats():
     """Get platform statistics"""
-    total_requests = await db.blood_requests.count_documents({})
-    active_requests = await db.blood_requests.count_documents({"status": "active"})
-    total_responses = await db.donor_responses.count_documents({})
-    total_users = await db.users.count_documents({})
+    stats = stats_cache.get("stats")
+    if stats:
+        return stats
     
-    return {
+    # Unfiltered totals come from collection metadata instead of a scan
+    total_requests, active_requests, total_responses, total_users = await asyncio.gather(
+        db.blood_requests.estimated_document_count(),
+        db.blood_requests.count_documents({"status": "active"}),
+        db.donor_responses.estimated_document_count(),
+        db.users.estimated_document_count()
+    )
+    
+    stats = {
         "total_requests": total_requests,
         "active_requests": active_requests,
         "total_responses": total_responses,
         "total_users": total_users
     }
+    stats_cache["stats"] = stats
+    return stats
 
 # Health check endpoint
 @api_router.get("/")
@@ -387,6 +606,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_db_client():
+    global client, db
+    client = AsyncMongoClient(
+        mongo_url,
+        maxPoolSize=int(os.environ.get('MONGO_POOL', '50')),
+        minPoolSize=5,
+        maxIdleTimeMS=30000,
+        waitQueueTimeoutMS=2000,
+        serverSelectionTimeoutMS=3000
+    )
+    db = client[os.environ['DB_NAME']]
+
+@app.on_event("startup")
+async def startup_http_client():
+    global http_client
+    http_client = httpx.AsyncClient(timeout=10.0, limits=httpx.Limits(max_keepalive_connections=20))
+
+async def create_unique_index(collection, keys, required: bool = False):
+    """Build a unique index; optional ones only log if existing duplicates block them"""
+    try:
+        await collection.create_index(keys, unique=True)
+    except OperationFailure as e:
+        if required:
+            raise RuntimeError(
+                f"Unique index {keys} on {collection.name} could not be built; "
+                f"remove the duplicate documents before starting: {e}"
+            ) from e
+        logger.error(
+            "Could not create unique index %s on %s; remove the duplicate documents and restart: %s",
+            keys, collection.name, e
+        )
+
+@app.on_event("startup")
+async def create_indexes():
+    await create_unique_index(db.blood_requests, "id")
+    await db.blood_requests.create_index([("status", 1), ("city", 1), ("urgency", 1), ("created_at", -1), ("id", -1)])
+    await db.blood_requests.create_index([("requester_id", 1), ("created_at", -1), ("id", -1)])
+    await create_unique_index(db.donor_responses, "id")
+    # The only guard against repeat donor responses, so startup fails without it
+    await create_unique_index(db.donor_responses, [("request_id", 1), ("donor_id", 1)], required=True)
+    await db.donor_responses.create_index([("request_id", 1), ("created_at", -1), ("id", -1)])
+    await db.donor_responses.create_index([("donor_id", 1), ("created_at", -1), ("id", -1)])
+    await create_unique_index(db.sessions, "session_token")
+    # TTL index lets Mongo purge sessions once expires_at has passed
+    await db.sessions.create_index("expires_at", expireAfterSeconds=0)
+    await create_unique_index(db.revoked_sessions, "session_token")
+    await db.revoked_sessions.create_index("expires_at", expireAfterSeconds=0)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await client.close()
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await http_client.aclose()
\ No newline at end of file
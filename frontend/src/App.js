@@ -1,4 +1,4 @@
-import React, { useState, useEffect, createContext, useContext } from "react";
+import React, { useState, useEffect, useRef, createContext, useContext } from "react";
 import { BrowserRouter, Routes, Route, Navigate, Link, useNavigate, useLocation } from "react-router-dom";
 import axios from "axios";
 import "./App.css";
@@ -235,8 +235,8 @@ const Dashboard = () => {
 
   const fetchRecentRequests = async () => {
     try {
-      const response = await axios.get(`${API}/requests?city=${user?.city}`);
-      setRecentRequests(response.data.slice(0, 5));
+      const response = await axios.get(`${API}/requests?city=${user?.city}&limit=5`);
+      setRecentRequests(response.data.items);
     } catch (error) {
       console.error('Error fetching requests:', error);
     }
@@ -244,8 +244,8 @@ const Dashboard = () => {
 
   const fetchMyRequests = async () => {
     try {
-      const response = await axios.get(`${API}/requests/my`, { withCredentials: true });
-      setMyRequests(response.data.slice(0, 3));
+      const response = await axios.get(`${API}/requests/my?limit=3`, { withCredentials: true });
+      setMyRequests(response.data.items);
     } catch (error) {
       console.error('Error fetching my requests:', error);
     }
@@ -772,7 +772,11 @@ const CreateRequest = () => {
 const BrowseRequests = () => {
   const { user } = useAuth();
   const [requests, setRequests] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // Bumped on every fetch so responses to superseded fetches are dropped
+  const latestFetch = useRef(0);
   const [filters, setFilters] = useState({
     city: user?.city || '',
     urgency: ''
@@ -782,19 +786,26 @@ const BrowseRequests = () => {
     fetchRequests();
   }, [filters]);
 
-  const fetchRequests = async () => {
-    setLoading(true);
+  const fetchRequests = async (cursor = null) => {
+    const fetchId = ++latestFetch.current;
+    const setBusy = cursor ? setLoadingMore : setLoading;
+    if (!cursor) setLoadingMore(false);
+    setBusy(true);
     try {
       const params = new URLSearchParams();
       if (filters.city) params.append('city', filters.city);
       if (filters.urgency) params.append('urgency', filters.urgency);
+      if (cursor) params.append('cursor', cursor);
       
       const response = await axios.get(`${API}/requests?${params}`);
-      setRequests(response.data);
+      if (fetchId !== latestFetch.current) return;
+      // A cursor fetches the next page, which is appended to the ones already shown
+      setRequests(prev => cursor ? [...prev, ...response.data.items] : response.data.items);
+      setNextCursor(response.data.next_cursor);
     } catch (error) {
       console.error('Error fetching requests:', error);
     } finally {
-      setLoading(false);
+      if (fetchId === latestFetch.current) setBusy(false);
     }
   };
 
@@ -947,6 +958,18 @@ const BrowseRequests = () => {
               </p>
             </div>
           )}
+
+          {nextCursor && (
+            <div className="text-center">
+              <button
+                onClick={() => fetchRequests(nextCursor)}
+                disabled={loadingMore}
+                className="bg-white hover:bg-gray-50 text-red-600 border border-red-600 px-6 py-2 rounded-md font-semibold disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more requests'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -0,0 +1,28 @@
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the live API suite unless RUN_LIVE_API_TESTS is set, so a plain pytest run stays offline"""
+    if os.environ.get("RUN_LIVE_API_TESTS"):
+        return
+    skip_live = pytest.mark.skip(reason="calls the deployed backend; set RUN_LIVE_API_TESTS=1 to run")
+    for item in items:
+        if "tester" in item.fixturenames:
+            item.add_marker(skip_live)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tester():
+    """One tester, with its HTTP session, Mongo client and seeded user, shared by the whole run"""
+    from backend_test import BloodDonationAPITester
+
+    tester = BloodDonationAPITester()
+    await tester.setup_test_data()
+    yield tester
+    await asyncio.gather(tester.cleanup_test_data(), tester.close_http_clients())
+    tester.mongo_client.close()
+
@@ -0,0 +1,39 @@
+import pytest
+
+# Share the session event loop with the tester fixture
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_health_check(tester):
+    assert await tester.test_health_check()
+
+
+async def test_database_connectivity(tester):
+    assert await tester.test_database_connectivity()
+
+
+async def test_authentication_system(tester):
+    assert await tester.test_authentication_system()
+
+
+async def test_jwt_session_revocation(tester):
+    assert await tester.test_jwt_session_revocation()
+
+
+async def test_blood_request_management(tester):
+    assert await tester.test_blood_request_management()
+
+
+async def test_donor_response_system(tester):
+    # Responds to the request created by test_blood_request_management
+    if tester.test_request_id is None:
+        pytest.skip("needs the request created by test_blood_request_management")
+    assert await tester.test_donor_response_system()
+
+
+async def test_statistics_api(tester):
+    assert await tester.test_statistics_api()
+
+
+async def test_error_handling(tester):
+    assert await tester.test_error_handling()